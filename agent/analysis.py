@@ -0,0 +1,217 @@
+import json
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import agent.minimax as minimax
+from agent.minimax import minimax as minimax_search, apply_move, is_king_captured
+from agent.moves import get_legal_moves
+
+
+# ===========================
+# Loading positions
+# ===========================
+def load_positions(path):
+    """
+    Reads a file of positions and returns a list of states
+    ({"board": ..., "turn": ...}, same shape the server sends).
+
+    Two formats are accepted:
+    - JSON: a single state, a list of states, or one state per line
+    - binary: back-to-back length-prefixed JSON frames, exactly the
+      wire format used by the server (4-byte big-endian length + UTF-8)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if data.lstrip()[:1] in (b"[", b"{"):
+        return _parse_json_positions(data.decode('utf-8'))
+    return _parse_binary_positions(data)
+
+
+def _parse_json_positions(text):
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        # JSON lines: one state per line
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    if isinstance(parsed, dict):
+        return [parsed]
+    return list(parsed)
+
+
+def _parse_binary_positions(data):
+    positions = []
+    offset = 0
+    while offset < len(data):
+        if offset + 4 > len(data):
+            raise ValueError("Truncated length prefix in binary position file")
+        length = struct.unpack('>I', data[offset:offset + 4])[0]
+        offset += 4
+        if offset + length > len(data):
+            raise ValueError("Truncated frame in binary position file")
+        positions.append(json.loads(data[offset:offset + length].decode('utf-8')))
+        offset += length
+    return positions
+
+
+# ===========================
+# Single-position analysis
+# ===========================
+def analyze_position(board, player_color, depth=None, movetime=None, multipv=3):
+    """
+    Multi-PV analysis of one position.
+    Returns the top `multipv` moves for player_color, each with its
+    minimax score and principal variation.
+
+    - depth only: fixed-depth search
+    - movetime: iterative deepening until the time budget is used
+      (capped at depth, if both are given)
+    """
+    start_time = time.time()
+
+    if movetime is None:
+        # minimax() never times out when started "at infinity"
+        lines = _search_root(board, depth, player_color, multipv, float('inf'))
+        return {"depth": depth, "lines": lines,
+                "elapsed": time.time() - start_time}
+
+    # minimax() stops once time.time() - start_time > TIME_LIMIT_SECONDS - 1,
+    # so shift its start time to make that happen exactly at our deadline
+    deadline = start_time + movetime
+    search_start = deadline - (minimax.TIME_LIMIT_SECONDS - 1)
+
+    lines = []
+    completed_depth = 0
+    current_depth = 1
+    while depth is None or current_depth <= depth:
+        candidate = _search_root(board, current_depth, player_color, multipv, search_start)
+
+        # An interrupted iteration is only trusted if we have nothing better
+        if time.time() > deadline and lines:
+            break
+
+        lines = candidate
+        completed_depth = current_depth
+        if time.time() > deadline:
+            break
+        current_depth += 1
+
+    return {"depth": completed_depth, "lines": lines,
+            "elapsed": time.time() - start_time}
+
+
+def _search_root(board, depth, player_color, multipv, start_time):
+    """
+    Scores every root move and keeps the best `multipv` of them.
+    Once `multipv` lines are known, the N-th best score is used as
+    alpha, so weaker moves fail low cheaply instead of being searched
+    with a full window.
+    """
+    moves = get_legal_moves(board, player_color)
+    scored = []
+
+    for move in moves:
+        new_board = apply_move(board, move)
+
+        if len(scored) < multipv:
+            alpha = float('-inf')
+        else:
+            alpha = scored[-1][0]
+
+        eval_score, _ = minimax_search(new_board, depth - 1,
+                                       alpha, float('inf'),
+                                       False, player_color,
+                                       start_time)
+
+        if len(scored) >= multipv and eval_score <= alpha:
+            continue
+
+        scored.append((eval_score, move))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        del scored[multipv:]
+
+    return [
+        {
+            "move": move,
+            "score": eval_score,
+            "pv": _principal_variation(board, move, depth, player_color, start_time),
+        }
+        for eval_score, move in scored
+    ]
+
+
+def _principal_variation(board, move, depth, player_color, start_time):
+    """
+    Rebuilds the principal variation starting with `move` by following
+    the best reply at each remaining depth.
+    """
+    pv = [move]
+    board = apply_move(board, move)
+    maximizing_player = False
+
+    for remaining in range(depth - 1, 0, -1):
+        if is_king_captured(board):
+            break
+        _, best_move = minimax_search(board, remaining,
+                                      float('-inf'), float('inf'),
+                                      maximizing_player, player_color,
+                                      start_time)
+        if best_move is None:
+            break
+        pv.append(best_move)
+        board = apply_move(board, best_move)
+        maximizing_player = not maximizing_player
+
+    return pv
+
+
+# ===========================
+# Batch analysis
+# ===========================
+def _analyze_job(index, state, player_color, depth, movetime, multipv):
+    color = player_color or (state.get("turn") if isinstance(state, dict) else None)
+    result = {"index": index, "turn": color}
+
+    if color not in ["WHITE", "BLACK"]:
+        result["error"] = f"Position has no side to move (turn: {color})"
+        return result
+
+    # A bad position must not end the whole stream
+    try:
+        result.update(analyze_position(state["board"], color,
+                                       depth=depth, movetime=movetime,
+                                       multipv=multipv))
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def analyze_positions(positions, depth=None, movetime=None, multipv=3,
+                      workers=None, player_color=None):
+    """
+    Analyzes many positions in parallel across a process pool.
+    This is a generator: results are yielded as soon as each position
+    finishes, so they come out of order; use result["index"] to match
+    them back to the input list.
+
+    player_color overrides the side to move stored in each state.
+    """
+    if depth is None and movetime is None:
+        raise ValueError("Either depth or movetime must be given")
+    if depth is not None and depth < 1:
+        raise ValueError("depth must be at least 1")
+    if movetime is not None and movetime <= 0:
+        raise ValueError("movetime must be positive")
+    if multipv < 1:
+        raise ValueError("multipv must be at least 1")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_analyze_job, index, state, player_color,
+                        depth, movetime, multipv)
+            for index, state in enumerate(positions)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,251 @@
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import agent.minimax as minimax
+from agent.minimax import apply_move
+from agent.moves import get_legal_moves
+from agent.evaluation import evaluate
+from agent.pn_search import winner, move_winner
+
+MCTS_WORKERS = os.cpu_count() or 1   # playout processes; 1 = no pool (main.py -workers)
+MCTS_LEAVES_PER_WORKER = 8           # leaves sent to each worker per round (one task each)
+MCTS_EXPLORATION = 1.4               # UCT exploration constant
+MCTS_VIRTUAL_LOSS = 1                # visits added to a path while its playout is pending
+MCTS_TIME_MARGIN = 2                 # seconds kept free before TIME_LIMIT_SECONDS ...
+MCTS_TIME_MARGIN_FRACTION = 0.25     # ... but never more than this share of it
+MCTS_MIN_ROUNDS = 4                  # rounds always run, even with no time left
+PLAYOUT_DEPTH = 8                    # random plies before the playout is scored
+PLAYOUT_SCALE = 200.0                # evaluate() score that maps to ~73% win chance
+
+_pool = None
+_pool_workers = 0
+_last_root = None
+
+
+# ===========================
+# Tree
+# ===========================
+def _opponent(color):
+    return "BLACK" if color == "WHITE" else "WHITE"
+
+
+class MCTSNode:
+    """
+    value_sum is stored from the perspective of the player who made
+    `move`, i.e. the parent's side to move, so UCT can maximize it
+    directly at every level.
+    """
+    __slots__ = ("board", "to_move", "move", "parent", "children",
+                 "untried", "visits", "value_sum", "virtual", "result")
+
+    def __init__(self, board, to_move, move=None, parent=None, result=None):
+        self.board = board
+        self.to_move = to_move
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.result = result
+        if self.result is None:
+            self.untried = get_legal_moves(board, to_move)
+            random.shuffle(self.untried)
+        else:
+            self.untried = []
+        self.visits = 0
+        self.value_sum = 0.0
+        self.virtual = 0
+
+    def is_terminal(self):
+        return self.result is not None or (not self.untried and not self.children)
+
+    def uct_child(self):
+        total = self.visits + self.virtual
+        log_total = math.log(max(total, 1))
+        best, best_score = None, float('-inf')
+        for child in self.children:
+            n = child.visits + child.virtual
+            if n == 0:
+                return child
+            # Pending playouts count as losses (virtual loss)
+            score = child.value_sum / n + MCTS_EXPLORATION * math.sqrt(log_total / n)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+
+def _terminal_value(node):
+    """
+    White win probability for a terminal node.
+    A side with no legal moves loses.
+    """
+    if node.result is not None:
+        return 1.0 if node.result == "WHITE" else 0.0
+    return 0.0 if node.to_move == "WHITE" else 1.0
+
+
+# ===========================
+# Playouts (run in worker processes)
+# ===========================
+def playout(board, to_move):
+    """
+    Heuristic playout: random moves, except that a move ending the game
+    (king escape or king capture) is always taken. After PLAYOUT_DEPTH
+    plies the board is scored with evaluate().
+    Returns the probability that WHITE wins, in [0, 1].
+    """
+    for _ in range(PLAYOUT_DEPTH):
+        moves = get_legal_moves(board, to_move)
+        if not moves:
+            return 0.0 if to_move == "WHITE" else 1.0
+
+        for move in moves:
+            if move_winner(board, move) == to_move:
+                return 1.0 if to_move == "WHITE" else 0.0
+
+        board = apply_move(board, random.choice(moves))
+        to_move = _opponent(to_move)
+
+    score = evaluate(board, "WHITE")
+    return 1.0 / (1.0 + math.exp(-score / PLAYOUT_SCALE))
+
+
+def _get_pool():
+    """
+    Returns the playout pool, rebuilding it if MCTS_WORKERS changed
+    since it was created (None when running serially).
+    """
+    global _pool, _pool_workers
+    if _pool is not None and _pool_workers != MCTS_WORKERS:
+        _pool.shutdown()
+        _pool = None
+
+    if _pool is None and MCTS_WORKERS > 1:
+        _pool = ProcessPoolExecutor(max_workers=MCTS_WORKERS)
+        _pool_workers = MCTS_WORKERS
+    return _pool
+
+
+# ===========================
+# Search
+# ===========================
+def _select(root):
+    """
+    Walks down the tree with UCT, expands one untried move and
+    applies a virtual loss to every node on the path.
+    """
+    node = root
+    while not node.untried and node.children and node.result is None:
+        node = node.uct_child()
+
+    if node.untried and node.result is None:
+        move = node.untried.pop()
+        child = MCTSNode(apply_move(node.board, move),
+                         _opponent(node.to_move), move, node,
+                         move_winner(node.board, move))
+        node.children.append(child)
+        node = child
+
+    walker = node
+    while walker is not None:
+        walker.virtual += MCTS_VIRTUAL_LOSS
+        walker = walker.parent
+    return node
+
+
+def _backpropagate(node, white_value):
+    while node is not None:
+        node.virtual -= MCTS_VIRTUAL_LOSS
+        node.visits += 1
+        # Credit the player who moved into this node
+        mover = _opponent(node.to_move)
+        node.value_sum += white_value if mover == "WHITE" else 1.0 - white_value
+        node = node.parent
+
+
+def _reuse_tree(board, player_color):
+    """
+    Looks for the current position among the grandchildren of the
+    previous root (our move, then the opponent's reply).
+    """
+    if _last_root is None:
+        return None
+    for child in _last_root.children:
+        if child.board == board and child.to_move == player_color:
+            child.parent = None
+            return child
+    return None
+
+
+def mcts(board, player_color, start_time):
+    """
+    Runs UCT from `board` until the time budget is spent and returns
+    the root node. With a pool, each round selects
+    MCTS_LEAVES_PER_WORKER leaves per worker (virtual loss keeps them
+    apart) and runs their playouts in parallel.
+    """
+    root = (_reuse_tree(board, player_color)
+            or MCTSNode(board, player_color, result=winner(board)))
+    pool = _get_pool()
+    batch_size = MCTS_WORKERS * MCTS_LEAVES_PER_WORKER if pool is not None else 1
+    time_limit = minimax.TIME_LIMIT_SECONDS
+    deadline = time_limit - min(MCTS_TIME_MARGIN, time_limit * MCTS_TIME_MARGIN_FRACTION)
+
+    rounds = 0
+    while rounds < MCTS_MIN_ROUNDS or time.time() - start_time < deadline:
+        rounds += 1
+        leaves = [_select(root) for _ in range(batch_size)]
+
+        pending = []
+        for leaf in leaves:
+            if leaf.is_terminal():
+                _backpropagate(leaf, _terminal_value(leaf))
+            else:
+                pending.append(leaf)
+
+        if pool is not None:
+            # One task per worker, not per playout, to keep IPC overhead down
+            chunksize = max(1, math.ceil(len(pending) / MCTS_WORKERS))
+            values = pool.map(playout,
+                              [leaf.board for leaf in pending],
+                              [leaf.to_move for leaf in pending],
+                              chunksize=chunksize)
+        else:
+            values = [playout(leaf.board, leaf.to_move) for leaf in pending]
+
+        for leaf, value in zip(pending, values):
+            _backpropagate(leaf, value)
+
+        if root.result is not None or (not root.untried and not root.children):
+            break
+
+    return root
+
+
+def get_next_move(state, player_color):
+    """
+    Entry point called by main.py when running with -engine mcts
+    """
+    global _last_root
+
+    board = state["board"]
+    start_time = time.time()
+
+    root = mcts(board, player_color, start_time)
+
+    if not root.children:
+        print("[WARNING] No MCTS move found → fallback to first legal move")
+        _last_root = None
+        moves = get_legal_moves(board, player_color)
+        if moves:
+            return moves[0]
+        return {"from": "A1", "to": "A1", "turn": player_color}
+
+    best = max(root.children, key=lambda child: child.visits)
+    print(f"[INFO] MCTS: {root.visits} playouts, best move visited {best.visits} times")
+
+    # Keep the chosen subtree for the next call
+    _last_root = best
+    best.parent = None
+    return best.move
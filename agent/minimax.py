@@ -151,6 +151,15 @@ def get_next_move(state, player_color):
 
     start_time = time.time()
 
+    # Endgame solver: near an escape or capture, try to prove a forced win first
+    from agent.pn_search import should_try_solver, solve, PN_TIME_FRACTION
+    if should_try_solver(board, player_color):
+        proven_move = solve(board, player_color,
+                            time_limit=TIME_LIMIT_SECONDS * PN_TIME_FRACTION)
+        if proven_move is not None:
+            print("[INFO] Proof-number search found a forced win")
+            return proven_move
+
     depth = 4 if player_color == "WHITE" else 3
 
     _, best_move = minimax(
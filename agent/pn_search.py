@@ -0,0 +1,256 @@
+import time
+from agent.moves import get_legal_moves, is_camp, is_castle
+from agent.minimax import apply_move
+from agent.evaluation import count_open_escape_lines, king_adjacent_black_count
+
+INFINITY = float('inf')
+
+PN_NODE_BUDGET = 1500    # max nodes expanded per solve() call
+PN_MAX_DEPTH = 7         # plies; deeper lines are treated as not proven
+PN_TIME_FRACTION = 0.02  # share of the move time get_next_move() gives the solver
+
+
+# ===========================
+# Terminal detection
+# ===========================
+def find_king(board):
+    for r, row in enumerate(board):
+        for c, cell in enumerate(row):
+            if cell == "KING":
+                return (r, c)
+    return None
+
+
+def is_escape_square(r, c, size):
+    """
+    White wins when the king reaches an edge square that is not a camp.
+    """
+    on_edge = r == 0 or c == 0 or r == size - 1 or c == size - 1
+    return on_edge and not is_camp(r, c, size)
+
+
+def winner(board):
+    """
+    Static result of a position: "BLACK" if the king is gone,
+    "WHITE" if it stands on an escape square, None otherwise.
+    King captures depend on the move that was just played,
+    see move_winner().
+    """
+    king_pos = find_king(board)
+    if king_pos is None:
+        return "BLACK"
+    if is_escape_square(king_pos[0], king_pos[1], len(board)):
+        return "WHITE"
+    return None
+
+
+def _to_coords(square):
+    return int(square[1]) - 1, ord(square[0]) - ord('A')
+
+
+def move_winner(board, move):
+    """
+    Result of playing `move` on `board` (the board BEFORE the move):
+    "WHITE" if the king escapes, "BLACK" if the king is captured,
+    None otherwise. The board is not copied.
+    """
+    from_r, from_c = _to_coords(move["from"])
+    to_r, to_c = _to_coords(move["to"])
+    size = len(board)
+    piece = board[from_r][from_c]
+
+    if piece == "KING":
+        return "WHITE" if is_escape_square(to_r, to_c, size) else None
+
+    if piece != "BLACK":
+        return None
+
+    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        kr = to_r + dr
+        kc = to_c + dc
+        if 0 <= kr < size and 0 <= kc < size and board[kr][kc] == "KING":
+            if _king_captured(board, (kr, kc), (to_r, to_c), (from_r, from_c), (dr, dc)):
+                return "BLACK"
+    return None
+
+
+def _hostile_to_king(board, r, c, mover_to, mover_from):
+    """
+    A square is hostile to the king if it holds a black piece
+    (after the move) or is an empty camp or the castle.
+    """
+    size = len(board)
+    if not (0 <= r < size and 0 <= c < size):
+        return False
+    if (r, c) == mover_to:
+        return True
+    if (r, c) == mover_from:
+        cell = "EMPTY"
+    else:
+        cell = board[r][c]
+    if cell == "BLACK":
+        return True
+    return cell == "EMPTY" and (is_camp(r, c, size) or is_castle(r, c, size))
+
+
+def _king_captured(board, king_pos, mover_to, mover_from, direction):
+    """
+    Ashton king capture, checked right after a black piece lands next to the king:
+    - on the castle: black on all four sides
+    - next to the castle: black on the three other sides
+    - elsewhere: sandwiched between the mover and a black piece, camp or castle
+    """
+    kr, kc = king_pos
+    size = len(board)
+    center = size // 2
+    sides = [(kr + dr, kc + dc) for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
+
+    if is_castle(kr, kc, size) or (center, center) in sides:
+        # The empty castle counts as hostile next to it, never for the king standing on it
+        return all(_hostile_to_king(board, r, c, mover_to, mover_from) for r, c in sides)
+
+    dr, dc = direction
+    return _hostile_to_king(board, kr + dr, kc + dc, mover_to, mover_from)
+
+
+# ===========================
+# Trigger detectors
+# ===========================
+def should_try_solver(board, player_color):
+    """
+    Cheap test for positions where a forced result is likely close:
+    - WHITE: the king already has an open line to the edge
+    - BLACK: the king has 3+ black pieces next to it
+    """
+    king_pos = find_king(board)
+    if king_pos is None:
+        return False
+
+    if player_color == "WHITE":
+        return count_open_escape_lines(board, king_pos) > 0
+    return king_adjacent_black_count(board, king_pos) >= 3
+
+
+# ===========================
+# Proof-number search
+# ===========================
+class PNNode:
+    """
+    Nodes only keep the move that led to them; boards are rebuilt
+    from the root along the selected path when a node is expanded.
+    """
+    __slots__ = ("to_move", "move", "parent", "children",
+                 "proof", "disproof", "depth")
+
+    def __init__(self, to_move, move, parent, depth):
+        self.to_move = to_move
+        self.move = move
+        self.parent = parent
+        self.children = None
+        self.proof = 1
+        self.disproof = 1
+        self.depth = depth
+
+
+def _opponent(color):
+    return "BLACK" if color == "WHITE" else "WHITE"
+
+
+def _set_numbers(node, result, attacker):
+    if result == attacker:
+        node.proof, node.disproof = 0, INFINITY
+    else:
+        node.proof, node.disproof = INFINITY, 0
+
+
+def _rebuild_board(root_board, node):
+    path = []
+    while node.move is not None:
+        path.append(node.move)
+        node = node.parent
+
+    board = root_board
+    for move in reversed(path):
+        board = apply_move(board, move)
+    return board
+
+
+def _expand(node, board, attacker):
+    moves = get_legal_moves(board, node.to_move)
+    node.children = []
+
+    if not moves:
+        # Side to move is stuck => it loses
+        _set_numbers(node, _opponent(node.to_move), attacker)
+        return
+
+    next_color = _opponent(node.to_move)
+    for move in moves:
+        child = PNNode(next_color, move, node, node.depth + 1)
+        result = move_winner(board, move)
+        if result is None and child.depth >= PN_MAX_DEPTH:
+            # Out of horizon: not proven for the attacker
+            result = _opponent(attacker)
+        if result is not None:
+            _set_numbers(child, result, attacker)
+        node.children.append(child)
+
+    _update_numbers(node, attacker)
+
+
+def _update_numbers(node, attacker):
+    if node.to_move == attacker:
+        # OR node: one proven child is enough
+        node.proof = min(child.proof for child in node.children)
+        node.disproof = sum(child.disproof for child in node.children)
+    else:
+        # AND node: every reply must be refuted
+        node.proof = sum(child.proof for child in node.children)
+        node.disproof = min(child.disproof for child in node.children)
+
+
+def _select_most_proving(node, attacker):
+    while node.children:
+        if node.to_move == attacker:
+            node = min(node.children, key=lambda child: child.proof)
+        else:
+            node = min(node.children, key=lambda child: child.disproof)
+    return node
+
+
+def solve(board, player_color, time_limit, node_budget=PN_NODE_BUDGET):
+    """
+    Tries to prove a forced win for player_color (the side to move)
+    within node_budget expansions and time_limit seconds.
+    Returns the winning move, or None if no win was proven.
+
+    Proofs are relative to get_legal_moves() and apply_move(), i.e.
+    the same move and pawn-capture rules the minimax search uses.
+    """
+    start_time = time.time()
+    if winner(board) is not None:
+        return None
+
+    root = PNNode(player_color, None, None, 0)
+
+    expanded = 0
+    while root.proof != 0 and root.disproof != 0:
+        if expanded >= node_budget or time.time() - start_time > time_limit:
+            return None
+
+        node = _select_most_proving(root, player_color)
+        _expand(node, _rebuild_board(board, node), player_color)
+        expanded += 1
+
+        node = node.parent
+        while node is not None:
+            _update_numbers(node, player_color)
+            node = node.parent
+
+    if root.proof != 0:
+        return None
+
+    for child in root.children:
+        if child.proof == 0:
+            return child.move
+    return None
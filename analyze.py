@@ -0,0 +1,78 @@
+import json
+import sys
+from agent.analysis import load_positions, analyze_positions
+
+
+USAGE = ("\nUsage: python analyze.py <positions file> [-depth N] [-movetime sec] "
+         "[-multipv N] [-workers N] [-color WHITE|BLACK]")
+
+
+def pop_option(args, flag, cast):
+    """
+    Removes `flag <value>` from args and returns the cast value,
+    or None if the flag is not present.
+    """
+    if flag not in args:
+        return None
+    try:
+        index = args.index(flag)
+        value = cast(args.pop(index + 1))
+        args.pop(index)
+        return value
+    except (IndexError, ValueError):
+        print(f"Error: {flag} must be followed by a valid value.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+
+    depth = pop_option(args, "-depth", int)
+    movetime = pop_option(args, "-movetime", float)
+    multipv = pop_option(args, "-multipv", int)
+    workers = pop_option(args, "-workers", int)
+    color = pop_option(args, "-color", str.upper)
+
+    if len(args) != 1:
+        print(USAGE)
+        sys.exit(1)
+
+    if multipv is None:
+        multipv = 3
+
+    if (depth is not None and depth < 1) or multipv < 1:
+        print("Error: -depth and -multipv must be at least 1.")
+        print(USAGE)
+        sys.exit(1)
+
+    if movetime is not None and movetime <= 0:
+        print("Error: -movetime must be positive.")
+        print(USAGE)
+        sys.exit(1)
+
+    if workers is not None and workers < 1:
+        print("Error: -workers must be at least 1.")
+        print(USAGE)
+        sys.exit(1)
+
+    if color is not None and color not in ["WHITE", "BLACK"]:
+        print("Error: -color must be WHITE or BLACK.")
+        sys.exit(1)
+
+    if depth is None and movetime is None:
+        depth = 3
+        print("[INFO] No -depth or -movetime given, using depth 3", file=sys.stderr)
+
+    try:
+        positions = load_positions(args[0])
+    except (OSError, ValueError) as e:
+        print(f"Error reading positions: {e}")
+        sys.exit(1)
+
+    print(f"[INFO] Analyzing {len(positions)} positions...", file=sys.stderr)
+
+    # One JSON object per line, printed as soon as each position is done
+    for result in analyze_positions(positions, depth=depth, movetime=movetime,
+                                    multipv=multipv, workers=workers,
+                                    player_color=color):
+        print(json.dumps(result), flush=True)
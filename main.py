@@ -4,6 +4,7 @@ import sys
 import struct
 import re
 from agent.minimax import get_next_move
+from agent.mcts import get_next_move as get_next_move_mcts
 
 HOST = 'localhost'
 PORTS = {
@@ -14,6 +15,10 @@ PLAYER_NAMES = {
     "WHITE": "AI_Ragazzi_W",
     "BLACK": "AI_Ragazzi_B"
 }
+ENGINES = {
+    "minimax": get_next_move,
+    "mcts": get_next_move_mcts
+}
 
 
 def write_message(sock, obj):
@@ -86,7 +91,7 @@ def parse_log_file(logfile_path, player_color):
     return moves
 
 
-def run_client(player_color, player_name, ip_address, replay_movess):
+def run_client(player_color, player_name, ip_address, replay_movess, engine="minimax"):
     port = PORTS[player_color]
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
@@ -126,7 +131,7 @@ def run_client(player_color, player_name, ip_address, replay_movess):
                         replay_movess = None
 
                     print("My turn. Thinking of a move...")
-                    action = get_next_move(state, player_color)
+                    action = ENGINES[engine](state, player_color)
 
                 if action:
                     print("\n" + "-" * 20)
@@ -154,6 +159,7 @@ def run_client(player_color, player_name, ip_address, replay_movess):
 
 if __name__ == "__main__":
     import agent.minimax as minimax   # <-- ensure we can override this safely
+    import agent.mcts as mcts         # <-- same for MCTS_WORKERS
 
     args = sys.argv[1:]  # everything after main.py
 
@@ -185,11 +191,44 @@ if __name__ == "__main__":
             print("Error: -timeout must be followed by a numeric value.")
             sys.exit(1)
 
+    # ----------------------------------------------------
+    # Handle -engine <minimax|mcts>
+    # ----------------------------------------------------
+    engine = "minimax"
+    if "-engine" in args:
+        try:
+            e_index = args.index("-engine")
+            engine = args.pop(e_index + 1).lower()
+            args.pop(e_index)
+        except (IndexError, ValueError):
+            print("Error: -engine must be followed by an engine name.")
+            sys.exit(1)
+        if engine not in ENGINES:
+            print(f"Error: unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+            sys.exit(1)
+        print(f"[INFO] Using {engine} engine")
+
+    # ----------------------------------------------------
+    # Handle -workers <N> (MCTS playout processes)
+    # ----------------------------------------------------
+    if "-workers" in args:
+        try:
+            w_index = args.index("-workers")
+            workers_value = int(args.pop(w_index + 1))
+            args.pop(w_index)
+            if workers_value < 1:
+                raise ValueError
+            mcts.MCTS_WORKERS = workers_value
+            print(f"[INFO] MCTS_WORKERS set to {workers_value} (from -workers flag)")
+        except (IndexError, ValueError):
+            print("Error: -workers must be followed by a positive integer.")
+            sys.exit(1)
+
     # ----------------------------------------------------
     # Basic usage check
     # ----------------------------------------------------
     if len(args) < 1 or args[0].upper() not in ["WHITE", "BLACK"]:
-        print("\nUsage: python main.py <WHITE|BLACK> [timeout] [ip] [-R logfile] [-timeout sec]")
+        print("\nUsage: python main.py <WHITE|BLACK> [timeout] [ip] [-R logfile] [-timeout sec] [-engine minimax|mcts] [-workers N]")
         sys.exit(1)
 
     # ----------------------------------------------------
@@ -232,5 +271,5 @@ if __name__ == "__main__":
     # ----------------------------------------------------
     # Start client
     # ----------------------------------------------------
-    run_client(color, name, ip, replay_moves)
+    run_client(color, name, ip, replay_moves, engine)
 